@@ -5,11 +5,16 @@ Advanced wireless signal detection and analysis tool
 """
 
 import argparse
+import os
 import sys
 import time
 from datetime import datetime
 import json
 import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from .detector import RFDetector
 from .visualizer import SignalVisualizer
 
@@ -22,8 +27,9 @@ Examples:
   rf-detector scan                          # Basic scan
   rf-detector scan -b 2.4G                  # Scan 2.4GHz band
   rf-detector scan -b 5G -t 30             # Scan 5GHz for 30 seconds
+  rf-detector scan -o scan_results.jsonl    # Save devices as JSON lines
   rf-detector monitor -c 6 -o output.json   # Monitor channel 6 and save results
-  rf-detector analyze -f scan_results.json  # Analyze previous scan
+  rf-detector analyze -f scan_results.jsonl # Analyze previous scan
         '''
     )
     
@@ -35,7 +41,10 @@ Examples:
                            default='2.4G', help='Frequency band to scan')
     scan_parser.add_argument('-t', '--time', type=int, default=60, 
                            help='Scan duration in seconds')
-    scan_parser.add_argument('-o', '--output', help='Output file for results')
+    scan_parser.add_argument('-o', '--output',
+                           help='Output file for detected devices, one JSON object per line '
+                                '(JSON lines, not a single JSON document); scan info and '
+                                'summary go to <name>.summary.json')
     scan_parser.add_argument('-v', '--visualize', action='store_true',
                            help='Show real-time visualization')
     
@@ -81,13 +90,16 @@ def run_scan(args):
     detector = RFDetector()
     visualizer = SignalVisualizer() if args.visualize else None
     
-    results = detector.scan_band(args.band, args.time, visualizer)
-    
-    # Save results if requested
+    # Stream devices to the output file as JSON lines while scanning
     if args.output:
         with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"[+] Results saved to {args.output}")
+            results = detector.scan_band(args.band, args.time, visualizer,
+                                         on_device=lambda device: f.write(_dumps(device) + '\n'))
+        summary_file = _summary_path(args.output)
+        _save_json(summary_file, {'scan_info': results['scan_info'], 'summary': results['summary']})
+        print(f"[+] Results saved to {args.output} (summary in {summary_file})")
+    else:
+        results = detector.scan_band(args.band, args.time, visualizer)
     
     # Print summary
     print_summary(results)
@@ -101,8 +113,7 @@ def run_monitor(args):
     results = detector.monitor_channel(args.channel, args.time)
     
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        _save_json(args.output, results)
         print(f"[+] Results saved to {args.output}")
     
     return 0
@@ -111,14 +122,72 @@ def run_analyze(args):
     """Execute analyze command"""
     print(f"[+] Analyzing results from {args.file}...")
     
-    with open(args.file, 'r') as f:
-        data = json.load(f)
+    data = _load_json(args.file)
     
     visualizer = SignalVisualizer()
     visualizer.analyze_results(data, args.plot)
     
     return 0
 
+def _json_default(obj):
+    """Serialize device timestamps as ISO 8601 strings"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj):
+    """Encode obj as compact JSON text, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, default=_json_default)
+
+def _summary_path(path):
+    """Sidecar file holding scan_info and summary for a JSON-lines scan file"""
+    return os.path.splitext(path)[0] + '.summary.json'
+
+def _loads(raw):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _save_json(path, data):
+    """Write results to path as indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+def _load_json(path):
+    """Read results from a JSON document or a JSON-lines scan file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    try:
+        data = _loads(raw)
+    except ValueError:
+        data = None
+    else:
+        if isinstance(data, dict) and 'devices' in data:
+            return data
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected a JSON object or JSON lines, "
+                             f"got a JSON {type(data).__name__}")
+    
+    # JSON lines written by run_scan, one device per line
+    devices = [_loads(line) for line in raw.splitlines() if line.strip()]
+    for lineno, device in enumerate(devices, 1):
+        if not isinstance(device, dict):
+            raise ValueError(f"{path}: JSON line {lineno} is not a device object")
+    data = {'devices': devices}
+    summary_file = _summary_path(path)
+    if os.path.exists(summary_file):
+        with open(summary_file, 'rb') as f:
+            data.update(_loads(f.read()))
+    return data
+
 def print_summary(results):
     """Print scan summary"""
     print("\n" + "="*50)
@@ -3,10 +3,97 @@ import random
 import json
 from datetime import datetime
 import threading
-try:
-    import numpy as np
-except ImportError:
-    np = None
+from collections.abc import Sequence
+import numpy as np
+
+# String tables for device fields; records store the index into these
+_SSID_TABLE = (
+    'Home_Network', 'TP-Link_ABCD', 'AndroidAP', 'iPhone',
+    'XfinityWiFi', 'ATTWiFi', 'NETGEAR', 'Linksys',
+    'Hidden_Network', 'Public_WiFi', 'Guest', None
+)
+_SEC_TABLE = ('WPA2', 'WPA3', 'WEP', 'Open')
+_BAND_TABLE = ('2.4G', '5G', 'all')
+_BAND_IDS = {band: i for i, band in enumerate(_BAND_TABLE)}
+
+# Number of simulated devices drawn per RNG batch
+_POOL_SIZE = 256
+
+# Number of device records per DeviceTile
+_TILE_SIZE = 1024
+
+# Capacity of the (channel, strength, ms since scan start) ring read by visualizers
+_RING_CAP = 4096
+
+def _expand(record):
+    """Turn an id-encoded device record into its full dict form"""
+    seen = datetime.fromtimestamp(record['first_seen'] / 1e9)
+    return {
+        'channel': record['channel'],
+        'strength': record['strength'],
+        'ssid': _SSID_TABLE[record['ssid_id']],
+        'band': _BAND_TABLE[record['band_id']],
+        'security': _SEC_TABLE[record['security_id']],
+        'first_seen': seen,
+        'last_seen': seen
+    }
+
+class DeviceTile:
+    """Fixed-size block of id-encoded device records stored column-wise"""
+    
+    FIELDS = ('channel', 'strength', 'band_id', 'security_id', 'ssid_id', 'first_seen')
+    
+    def __init__(self, size=_TILE_SIZE):
+        self.channel = np.empty(size, dtype=np.int16)
+        self.strength = np.empty(size, dtype=np.int8)
+        self.band_id = np.empty(size, dtype=np.uint8)
+        self.security_id = np.empty(size, dtype=np.uint8)
+        self.ssid_id = np.empty(size, dtype=np.uint8)
+        self.first_seen = np.empty(size, dtype=np.int64)
+        self.count = 0
+    
+    @property
+    def full(self):
+        return self.count == self.channel.size
+    
+    def append(self, record):
+        """Store an id-encoded record in the next free row"""
+        i = self.count
+        for name in self.FIELDS:
+            getattr(self, name)[i] = record[name]
+        self.count = i + 1
+    
+    def column(self, name):
+        """View of the filled rows of a column"""
+        return getattr(self, name)[:self.count]
+    
+    def record(self, row):
+        """Materialize one row as a device dict"""
+        if not 0 <= row < self.count:
+            raise IndexError('tile row out of range')
+        return _expand({name: getattr(self, name)[row].item() for name in self.FIELDS})
+    
+    def records(self):
+        """Materialize all filled rows as device dicts"""
+        columns = [self.column(name).tolist() for name in self.FIELDS]
+        return [_expand(dict(zip(self.FIELDS, row))) for row in zip(*columns)]
+
+class DeviceList(Sequence):
+    """Read-only list view of a detector's devices, materialized on access"""
+    
+    def __init__(self, detector):
+        self._detector = detector
+    
+    def __len__(self):
+        return self._detector.device_count
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._detector.device(i) for i in range(*index.indices(len(self)))]
+        return self._detector.device(index)
+    
+    def __iter__(self):
+        return self._detector.iter_devices()
 
 class RFDetector:
     """Advanced RF Signal Detection Engine"""
@@ -17,14 +104,58 @@ class RFDetector:
     
     def __init__(self):
         self.is_scanning = False
+        # Detected devices are stored in column-wise tiles with string
+        # fields as table ids and are only turned into dicts on demand,
+        # through results['devices'], `devices` or `device(index)`.
         self.results = {
-            'devices': [],
+            'devices': DeviceList(self),
             'scan_info': {},
             'summary': {}
         }
+        self._tiles = []
+        self._count = 0
+        
+        # Pre-drawn random attributes for simulated devices, see _prefill
+        self._rng = np.random.default_rng()
+        self._pool_strength = []
+        self._pool_ssid = []
+        self._pool_security = []
+        self._pool_pos = 0
+        
+        # Set when a device is recorded or the scan stops, see wait_for_device
+        self._new_device = threading.Event()
+        self._stopped = threading.Event()
+        
+        # Single-writer ring of recent detections, see read_ring
+        self._ring = np.empty((_RING_CAP, 3), dtype=np.int32)
+        self._ring_idx = 0
+    
+    @property
+    def device_count(self):
+        """Number of devices detected so far"""
+        return self._count
+    
+    @property
+    def devices(self):
+        """Detected devices materialized as a list of dicts"""
+        return list(self.iter_devices())
+    
+    def iter_devices(self):
+        """Yield detected devices as dicts, materializing one tile at a time"""
+        for tile in self._tiles:
+            yield from tile.records()
     
-    def scan_band(self, band='2.4G', duration=60, visualizer=None):
-        """Scan specified frequency band"""
+    def device(self, index):
+        """Materialize a single detected device as a dict"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('device index out of range')
+        tile, row = divmod(index, _TILE_SIZE)
+        return self._tiles[tile].record(row)
+    
+    def scan_band(self, band='2.4G', duration=60, visualizer=None, on_device=None):
+        """Scan specified frequency band, passing each new device dict to on_device"""
         channels = self.CHANNELS_2G if band == '2.4G' else self.CHANNELS_5G
         if band == 'all':
             channels = self.CHANNELS_2G + self.CHANNELS_5G
@@ -37,6 +168,7 @@ class RFDetector:
         }
         
         self.is_scanning = True
+        self._stopped.clear()
         start_time = time.time()
         
         # Start visualization in separate thread if requested
@@ -58,15 +190,21 @@ class RFDetector:
                     break
                     
                 device = self._simulate_device(channel, band)
-                self.results['devices'].append(device)
+                elapsed_ms = int((time.time() - start_time) * 1000)
+                self._ring[self._ring_idx % _RING_CAP] = (channel, device['strength'], elapsed_ms)
+                self._ring_idx += 1
+                self._record_device(device)
+                self._new_device.set()
+                if on_device:
+                    on_device(_expand(device))
                 
                 # Print device info
-                ssid = device['ssid'] or 'Hidden Network'
+                ssid = _SSID_TABLE[device['ssid_id']] or 'Hidden Network'
                 print(f"{channel:2d}\t{device['strength']:3d} dBm\t{ssid}")
                 
-                time.sleep(0.5)
+                self._stopped.wait(0.5)
             
-            time.sleep(2)
+            self._stopped.wait(2)
         
         self._generate_summary()
         return self.results
@@ -78,14 +216,20 @@ class RFDetector:
         print("-" * 40)
         
         activity_data = []
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        while time.time() - start_time < duration:
-            # Simulate network activity
-            strength = random.randint(-90, -20)
-            packets = random.randint(0, 1000)
+        # Simulated network activity, one sample per second
+        samples = max(duration, 0)
+        strengths = self._rng.integers(-90, -19, size=samples, dtype=np.int8).tolist()
+        packet_counts = self._rng.integers(0, 1001, size=samples, dtype=np.int16).tolist()
+        i = 0
+        
+        while i < len(strengths) and time.monotonic() - start_time < duration:
+            strength = strengths[i]
+            packets = packet_counts[i]
+            i += 1
             
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = time.strftime("%H:%M:%S")
             print(f"{timestamp}\t{strength:3d} dBm\t{packets:4d}")
             
             activity_data.append({
@@ -102,49 +246,99 @@ class RFDetector:
             'activity': activity_data
         }
     
+    def _prefill(self, n=_POOL_SIZE):
+        """Draw random attributes for the next n simulated devices"""
+        self._pool_strength = self._rng.integers(-90, -19, size=n, dtype=np.int8).tolist()
+        self._pool_ssid = self._rng.integers(0, len(_SSID_TABLE), size=n).tolist()
+        self._pool_security = self._rng.integers(0, len(_SEC_TABLE), size=n).tolist()
+        self._pool_pos = 0
+    
     def _simulate_device(self, channel, band):
-        """Simulate detecting a wireless device"""
-        strengths = ['Very Strong', 'Strong', 'Good', 'Fair', 'Weak']
-        ssids = [
-            'Home_Network', 'TP-Link_ABCD', 'AndroidAP', 'iPhone',
-            'XfinityWiFi', 'ATTWiFi', 'NETGEAR', 'Linksys',
-            'Hidden_Network', 'Public_WiFi', 'Guest', None
-        ]
+        """Simulate detecting a wireless device, as an id-encoded record"""
+        if self._pool_pos >= len(self._pool_strength):
+            self._prefill()
+        i = self._pool_pos
+        self._pool_pos += 1
         
         return {
             'channel': channel,
-            'strength': random.randint(-90, -20),
-            'ssid': random.choice(ssids),
-            'band': band,
-            'security': random.choice(['WPA2', 'WPA3', 'WEP', 'Open']),
-            'first_seen': datetime.now().isoformat(),
-            'last_seen': datetime.now().isoformat()
+            'strength': self._pool_strength[i],
+            'ssid_id': self._pool_ssid[i],
+            'band_id': _BAND_IDS[band],
+            'security_id': self._pool_security[i],
+            'first_seen': time.time_ns()
         }
     
+    def _record_device(self, device):
+        """Append a detected device to the active tile"""
+        if not self._tiles or self._tiles[-1].full:
+            self._tiles.append(DeviceTile())
+        self._tiles[-1].append(device)
+        self._count += 1
+    
     def _generate_summary(self):
         """Generate scan summary"""
-        if not self.results['devices']:
+        if not self.device_count:
             self.results['summary'] = {
                 'total_signals': 0,
                 'avg_strength': 0,
                 'max_strength': 0,
-                'channels': set(),
+                'channels': [],
                 'duration': 0
             }
             return
         
-        strengths = [d['strength'] for d in self.results['devices']]
-        channels = set(d['channel'] for d in self.results['devices'])
+        # Reduce each tile separately; a tile's columns fit in L1
+        total = 0
+        max_strength = -128
+        min_strength = 127
+        channels = set()
+        for tile in self._tiles:
+            strengths = tile.column('strength')
+            total += int(strengths.sum(dtype=np.int64))
+            max_strength = max(max_strength, int(strengths.max()))
+            min_strength = min(min_strength, int(strengths.min()))
+            channels.update(np.unique(tile.column('channel')).tolist())
         
         self.results['summary'] = {
-            'total_signals': len(self.results['devices']),
-            'avg_strength': int(sum(strengths) / len(strengths)),
-            'max_strength': max(strengths),
-            'min_strength': min(strengths),
-            'channels': list(channels),
+            'total_signals': self.device_count,
+            'avg_strength': int(total / self.device_count),
+            'max_strength': max_strength,
+            'min_strength': min_strength,
+            'channels': sorted(channels),
             'duration': self.results['scan_info']['duration']
         }
     
+    def read_ring(self, start):
+        """
+        Return (end, rows) with the ring entries published after index start.
+        Rows are (channel, strength, ms since scan start); entries already
+        overwritten by the scanner are skipped.
+        """
+        end = self._ring_idx
+        start = max(start, end - _RING_CAP)
+        lo, hi = start % _RING_CAP, end % _RING_CAP
+        if start == end:
+            rows = self._ring[:0]
+        elif lo < hi:
+            rows = self._ring[lo:hi]
+        else:
+            rows = np.concatenate((self._ring[lo:], self._ring[:hi]))
+        return end, rows
+    
+    def wait_for_device(self, timeout=None):
+        """
+        Block until a new device is recorded or the scan stops. The event
+        is cleared before returning, so callers must then read everything
+        published since their own last read (device_count or read_ring)
+        rather than only the latest device.
+        """
+        fired = self._new_device.wait(timeout)
+        self._new_device.clear()
+        return fired
+    
     def stop_scan(self):
         """Stop ongoing scan"""
         self.is_scanning = False
+        self._stopped.set()
+        self._new_device.set()
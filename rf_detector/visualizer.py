@@ -1,14 +1,45 @@
 import time
 import json
 from datetime import datetime
+from collections import Counter
+from types import SimpleNamespace
+import numpy as np
 
 try:
     import matplotlib.pyplot as plt
-    import numpy as np
     PLOTTING_AVAILABLE = True
 except ImportError:
     PLOTTING_AVAILABLE = False
 
+# Fixed palette for the security types bar chart
+_SECURITY_COLORS = ('gold', 'lightblue', 'lightgreen', 'orange')
+
+def _int16_column(values):
+    """Values as an array, narrowed to int16 only when no value would change"""
+    col = np.asarray(values)
+    if col.dtype.kind in 'iu' and col.size and col.min() >= -32768 and col.max() <= 32767:
+        return col.astype(np.int16)
+    return col
+
+def _fused_stats(devices):
+    """Collect columns, strength range and security counts in one pass"""
+    channels = []
+    strengths = []
+    mn = float('inf')
+    mx = float('-inf')
+    security = Counter()
+    for d in devices:
+        v = d['strength']
+        channels.append(d['channel'])
+        strengths.append(v)
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+        security[d.get('security', 'Unknown')] += 1
+    return SimpleNamespace(channels=channels, strengths=strengths, min=mn, max=mx,
+                           security=security)
+
 class SignalVisualizer:
     """Advanced Signal Visualization"""
     
@@ -24,40 +55,56 @@ class SignalVisualizer:
         plt.ion()
         self.fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
         
+        # Signal strength over time
+        line, = ax1.plot([], [], 'b-', alpha=0.7)
+        ax1.set_title('Signal Strength Over Time')
+        ax1.set_ylabel('Strength (dBm)')
+        ax1.grid(True, alpha=0.3)
+        
+        # Channel distribution, one bar per scanned channel
+        scan_channels = detector.results['scan_info']['channels']
+        slots = {channel: i for i, channel in enumerate(scan_channels)}
+        counts = np.zeros(len(scan_channels), dtype=np.int64)
+        bars = ax2.bar(scan_channels, counts, alpha=0.7, edgecolor='black')
+        ax2.set_title('Channel Distribution')
+        ax2.set_xlabel('Channel')
+        ax2.set_ylabel('Count')
+        ax2.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        
         start_time = time.time()
-        timestamps = []
-        strengths = []
-        channels = []
+        timestamps = np.empty(max(duration, 0) + 1)
+        strengths = np.empty(max(duration, 0) + 1)
+        n = 0
+        read = 0
         
         while time.time() - start_time < duration and detector.is_scanning:
-            if detector.results['devices']:
-                # Update data
-                latest = detector.results['devices'][-1]
-                timestamps.append(time.time() - start_time)
-                strengths.append(latest['strength'])
-                channels.append(latest['channel'])
+            if detector.wait_for_device(timeout=1.0):
+                # Update data with every detection since the last tick
+                read, rows = detector.read_ring(read)
+                if not len(rows):
+                    continue
+                if n + len(rows) > timestamps.size:
+                    size = max(2 * timestamps.size, n + len(rows))
+                    timestamps = np.resize(timestamps, size)
+                    strengths = np.resize(strengths, size)
+                timestamps[n:n + len(rows)] = rows[:, 2] / 1000
+                strengths[n:n + len(rows)] = rows[:, 1]
+                n += len(rows)
                 
-                # Clear and replot
-                ax1.clear()
-                ax2.clear()
+                line.set_data(timestamps[:n], strengths[:n])
+                ax1.relim()
+                ax1.autoscale_view()
                 
-                # Signal strength over time
-                ax1.plot(timestamps, strengths, 'b-', alpha=0.7)
-                ax1.set_title('Signal Strength Over Time')
-                ax1.set_ylabel('Strength (dBm)')
-                ax1.grid(True, alpha=0.3)
+                for channel in rows[:, 0].tolist():
+                    slot = slots[channel]
+                    counts[slot] += 1
+                    bars[slot].set_height(counts[slot])
+                ax2.relim()
+                ax2.autoscale_view()
                 
-                # Channel distribution
-                ax2.hist(channels, bins=20, alpha=0.7, edgecolor='black')
-                ax2.set_title('Channel Distribution')
-                ax2.set_xlabel('Channel')
-                ax2.set_ylabel('Count')
-                ax2.grid(True, alpha=0.3)
-                
-                plt.tight_layout()
                 plt.pause(0.1)
-            
-            time.sleep(1)
         
         plt.ioff()
     
@@ -71,48 +118,42 @@ class SignalVisualizer:
         print("DETAILED ANALYSIS")
         print("="*50)
         
-        # Channel analysis
-        channels = [d['channel'] for d in data['devices']]
-        unique_channels = set(channels)
+        stats = _fused_stats(data['devices'])
+        channels = _int16_column(stats.channels)
         
-        print(f"Channels with activity: {sorted(unique_channels)}")
+        # Channel analysis
+        print(f"Channels with activity: {np.unique(channels).tolist()}")
         
         # Strength analysis
-        strengths = [d['strength'] for d in data['devices']]
-        print(f"Signal strength range: {min(strengths)} to {max(strengths)} dBm")
+        print(f"Signal strength range: {stats.min} to {stats.max} dBm")
         
         # Security analysis
-        security = {}
-        for device in data['devices']:
-            sec = device.get('security', 'Unknown')
-            security[sec] = security.get(sec, 0) + 1
-        
         print("\nSecurity Types:")
-        for sec_type, count in security.items():
+        for sec_type, count in stats.security.items():
             print(f"  {sec_type}: {count} networks")
         
         if generate_plots and PLOTTING_AVAILABLE:
-            self._generate_analysis_plots(data)
+            self._generate_analysis_plots(data, stats, channels)
     
-    def _generate_analysis_plots(self, data):
+    def _generate_analysis_plots(self, data, stats, channels):
         """Generate detailed analysis plots"""
         if not PLOTTING_AVAILABLE:
             print("[!] matplotlib not available for plotting")
             return
         
-        devices = data['devices']
-        
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
+        # Typed columns shared by all artists below
+        strengths = _int16_column(stats.strengths)
+        security_types = stats.security
+        
         # Channel distribution
-        channels = [d['channel'] for d in devices]
         ax1.hist(channels, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
         ax1.set_title('Channel Distribution')
         ax1.set_xlabel('Channel')
         ax1.set_ylabel('Number of Networks')
         
         # Signal strength distribution
-        strengths = [d['strength'] for d in devices]
         ax2.hist(strengths, bins=15, alpha=0.7, color='lightcoral', edgecolor='black')
         ax2.set_title('Signal Strength Distribution')
         ax2.set_xlabel('Strength (dBm)')
@@ -126,13 +167,8 @@ class SignalVisualizer:
         ax3.grid(True, alpha=0.3)
         
         # Security types
-        security_types = {}
-        for device in devices:
-            sec = device.get('security', 'Unknown')
-            security_types[sec] = security_types.get(sec, 0) + 1
-        
-        ax4.bar(security_types.keys(), security_types.values(), 
-                color=['gold', 'lightblue', 'lightgreen', 'orange'])
+        ax4.bar(list(security_types.keys()), np.fromiter(security_types.values(), dtype=np.int64), 
+                color=_SECURITY_COLORS)
         ax4.set_title('Security Types Distribution')
         ax4.set_ylabel('Count')
         plt.xticks(rotation=45)
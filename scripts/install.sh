@@ -46,7 +46,7 @@ echo ""
 echo "3. Example commands:"
 echo "   rf-detector scan -b 2.4G -t 30"
 echo "   rf-detector monitor -c 6 -t 60"
-echo "   rf-detector analyze -f results.json -p"
+echo "   rf-detector analyze -f results.jsonl -p"
 echo ""
 echo "For development:"
 echo "   pip install -e .[dev]"
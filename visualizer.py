@@ -2,17 +2,105 @@ import time
 import json
 from datetime import datetime
 import os
+from collections import Counter
+from heapq import nlargest
+from types import SimpleNamespace
+import numpy as np
 
 try:
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
     import matplotlib.pyplot as plt
-    import numpy as np
     PLOTTING_AVAILABLE = True
 except ImportError:
     PLOTTING_AVAILABLE = False
     print("[!] matplotlib not available - plotting disabled")
 
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+
+if nb is not None:
+    @nb.njit(cache=True)
+    def _chan_avg(channels, strengths, n_chan_max):
+        """Per-channel strength sums and counts in a single pass"""
+        sums = np.zeros(n_chan_max + 1, np.float64)
+        cnts = np.zeros(n_chan_max + 1, np.int64)
+        for i in range(channels.size):
+            c = channels[i]
+            sums[c] += strengths[i]
+            cnts[c] += 1
+        return sums, cnts
+else:
+    def _chan_avg(channels, strengths, n_chan_max):
+        """Per-channel strength sums and counts (numba not available)"""
+        sums = np.bincount(channels, weights=strengths, minlength=n_chan_max + 1)
+        cnts = np.bincount(channels, minlength=n_chan_max + 1)
+        return sums, cnts
+
+# Fixed palettes for the security and visibility pie charts
+_SECURITY_COLORS = ('#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc')
+_VISIBILITY_COLORS = ('#4CAF50', '#FF9800')
+
+# viridis colors for n bars, keyed by n
+_VIRIDIS_CACHE = {}
+
+def _viridis(n):
+    """Return n evenly spaced viridis colors, computed once per n"""
+    colors = _VIRIDIS_CACHE.get(n)
+    if colors is None:
+        colors = _VIRIDIS_CACHE[n] = plt.cm.viridis(np.linspace(0, 1, n))
+    return colors
+
+def _int16_column(values):
+    """Values as an array, narrowed to int16 only when no value would change"""
+    col = np.asarray(values)
+    if col.dtype.kind in 'iu' and col.size and col.min() >= -32768 and col.max() <= 32767:
+        return col.astype(np.int16)
+    return col
+
+def _fused_stats(devices):
+    """Collect columns, strength stats and security/hidden counts in one pass"""
+    channels = []
+    strengths = []
+    mn = float('inf')
+    mx = float('-inf')
+    total = 0
+    security = Counter()
+    hidden = 0
+    for d in devices:
+        v = d['strength']
+        channels.append(d['channel'])
+        strengths.append(v)
+        total += v
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+        security[d.get('security', 'Unknown')] += 1
+        ssid = d.get('ssid')
+        hidden += not ssid or ssid == 'Hidden'
+    return SimpleNamespace(channels=channels, strengths=strengths, min=mn, max=mx,
+                           mean=total / len(devices), security=security, hidden=hidden)
+
+def _extract_cols(devices):
+    """Extract per-device columns and counts shared by the analysis and plots"""
+    stats = _fused_stats(devices)
+    channels = _int16_column(stats.channels)
+    return SimpleNamespace(
+        channels=channels,
+        strengths=_int16_column(stats.strengths),
+        unique_channels=np.unique(channels),
+        min_strength=stats.min,
+        max_strength=stats.max,
+        avg_strength=stats.mean,
+        security=stats.security,
+        visible=len(devices) - stats.hidden,
+        hidden=stats.hidden
+    )
+
 class SignalVisualizer:
     """Robust Signal Visualization without threading issues"""
     
@@ -23,6 +111,9 @@ class SignalVisualizer:
             'channels': [],
             'ssids': []
         }
+        # Analysis figures reused across runs, and their current colorbars
+        self._figures = {}
+        self._colorbars = {}
     
     def realtime_plot(self, detector, duration):
         """
@@ -38,18 +129,32 @@ class SignalVisualizer:
         
         # Just collect data without plotting
         start_time = time.time()
+        read = 0
         
         while time.time() - start_time < duration and detector.is_scanning:
-            if detector.results['devices']:
-                latest = detector.results['devices'][-1]
+            if detector.wait_for_device(timeout=1.0):
+                # Collect every device recorded since the last wakeup
                 current_time = time.time() - start_time
-                
-                self.scan_data['timestamps'].append(current_time)
-                self.scan_data['strengths'].append(latest['strength'])
-                self.scan_data['channels'].append(latest['channel'])
-                self.scan_data['ssids'].append(latest.get('ssid', 'Unknown'))
-            
-            time.sleep(1)
+                count = detector.device_count
+                for i in range(read, count):
+                    device = detector.device(i)
+                    self.scan_data['timestamps'].append(current_time)
+                    self.scan_data['strengths'].append(device['strength'])
+                    self.scan_data['channels'].append(device['channel'])
+                    self.scan_data['ssids'].append(device.get('ssid', 'Unknown'))
+                read = count
+    
+    def _get_figure(self, name, nrows, ncols, figsize):
+        """Return a cached figure and its axes, cleared for redrawing"""
+        if name not in self._figures:
+            self._figures[name] = plt.subplots(nrows, ncols, figsize=figsize)
+        fig, axes = self._figures[name]
+        
+        for colorbar in self._colorbars.pop(name, []):
+            colorbar.remove()
+        for ax in axes.flat:
+            ax.cla()
+        return fig, axes
     
     def analyze_results(self, data, generate_plots=False):
         """Analyze and visualize scan results with static plots"""
@@ -64,34 +169,25 @@ class SignalVisualizer:
         devices = data['devices']
         
         # Basic statistics
-        strengths = [d['strength'] for d in devices]
-        channels = [d['channel'] for d in devices]
-        ssids = [d.get('ssid', 'Hidden') for d in devices]
+        cols = _extract_cols(devices)
+        security = cols.security
         
         print(f"📶 Total Networks Detected: {len(devices)}")
-        print(f"📡 Channels with Activity: {sorted(set(channels))}")
-        print(f"💪 Signal Strength Range: {min(strengths)} to {max(strengths)} dBm")
-        print(f"📊 Average Signal Strength: {sum(strengths)/len(strengths):.1f} dBm")
+        print(f"📡 Channels with Activity: {cols.unique_channels.tolist()}")
+        print(f"💪 Signal Strength Range: {cols.min_strength} to {cols.max_strength} dBm")
+        print(f"📊 Average Signal Strength: {cols.avg_strength:.1f} dBm")
         
         # Network analysis
-        visible_networks = [ssid for ssid in ssids if ssid and ssid != 'Hidden']
-        hidden_networks = len([ssid for ssid in ssids if not ssid or ssid == 'Hidden'])
-        
-        print(f"🔍 Visible Networks: {len(visible_networks)}")
-        print(f"🕶️  Hidden Networks: {hidden_networks}")
+        print(f"🔍 Visible Networks: {cols.visible}")
+        print(f"🕶️  Hidden Networks: {cols.hidden}")
         
         # Security analysis
-        security = {}
-        for device in devices:
-            sec = device.get('security', 'Unknown')
-            security[sec] = security.get(sec, 0) + 1
-        
         print(f"\n🔒 Security Types:")
         for sec_type, count in security.items():
             print(f"   {sec_type}: {count} networks")
         
         # Top 5 strongest signals
-        strongest = sorted(devices, key=lambda x: x['strength'], reverse=True)[:5]
+        strongest = nlargest(5, devices, key=lambda d: d['strength'])
         print(f"\n🏆 Top 5 Strongest Signals:")
         for i, device in enumerate(strongest, 1):
             ssid = device.get('ssid', 'Hidden Network')
@@ -99,37 +195,32 @@ class SignalVisualizer:
         
         # Generate static plots if requested
         if generate_plots and PLOTTING_AVAILABLE:
-            self._generate_static_plots(data)
+            self._generate_static_plots(data, cols)
         elif generate_plots and not PLOTTING_AVAILABLE:
             print(f"\n[!] matplotlib not available for plotting")
             print(f"[!] Install with: pip install matplotlib")
     
-    def _generate_static_plots(self, data):
+    def _generate_static_plots(self, data, cols):
         """Generate comprehensive static plots"""
         try:
-            devices = data['devices']
-            
             # Create analysis directory
             os.makedirs('analysis_plots', exist_ok=True)
             
             # Plot 1: Comprehensive overview
-            fig = plt.figure(figsize=(15, 12))
+            fig, ((ax1, ax2), (ax3, ax4)) = self._get_figure('overview', 2, 2, (15, 12))
             fig.suptitle('RF Signal Detector - Comprehensive Analysis\nSignal Research Lab', 
                         fontsize=16, fontweight='bold', y=0.98)
             
             # Data preparation
-            channels = [d['channel'] for d in devices]
-            strengths = [d['strength'] for d in devices]
-            ssids = [d.get('ssid', 'Hidden') for d in devices]
-            security_types = [d.get('security', 'Unknown') for d in devices]
+            channels = cols.channels
+            strengths = cols.strengths
+            unique_channels = cols.unique_channels
             
             # Subplot 1: Channel distribution
-            ax1 = plt.subplot(2, 2, 1)
-            unique_channels = sorted(set(channels))
-            channel_counts = [channels.count(ch) for ch in unique_channels]
+            channel_counts = np.bincount(channels)[unique_channels]
             
             bars = ax1.bar(unique_channels, channel_counts, 
-                          color=plt.cm.viridis(np.linspace(0, 1, len(unique_channels))),
+                          color=_viridis(len(unique_channels)),
                           alpha=0.7, edgecolor='black')
             
             ax1.set_title('Channel Distribution', fontweight='bold', pad=20)
@@ -144,7 +235,6 @@ class SignalVisualizer:
                         f'{int(height)}', ha='center', va='bottom', fontweight='bold')
             
             # Subplot 2: Signal strength distribution
-            ax2 = plt.subplot(2, 2, 2)
             strength_ranges = ['-90 to -80', '-80 to -70', '-70 to -60', '-60 to -50', '-50 to -40', '-40 to -30', '-30 to -20']
             strength_bins = [-90, -80, -70, -60, -50, -40, -30, -20]
             hist, bins, patches = ax2.hist(strengths, bins=strength_bins, 
@@ -157,97 +247,77 @@ class SignalVisualizer:
             ax2.grid(True, alpha=0.3)
             
             # Subplot 3: Channel vs Strength
-            ax3 = plt.subplot(2, 2, 3)
             scatter = ax3.scatter(channels, strengths, c=strengths, 
                                  cmap='RdYlGn_r', alpha=0.6, s=60)
             ax3.set_title('Channel vs Signal Strength', fontweight='bold', pad=20)
             ax3.set_xlabel('Channel')
             ax3.set_ylabel('Strength (dBm)')
             ax3.grid(True, alpha=0.3)
-            plt.colorbar(scatter, ax=ax3, label='Signal Strength (dBm)')
+            self._colorbars['overview'] = [fig.colorbar(scatter, ax=ax3, label='Signal Strength (dBm)')]
             
             # Subplot 4: Security types
-            ax4 = plt.subplot(2, 2, 4)
-            security_count = {}
-            for sec in security_types:
-                security_count[sec] = security_count.get(sec, 0) + 1
-            
-            colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc']
-            wedges, texts, autotexts = ax4.pie(security_count.values(), 
-                                              labels=security_count.keys(),
+            wedges, texts, autotexts = ax4.pie(cols.security.values(), 
+                                              labels=cols.security.keys(),
                                               autopct='%1.1f%%',
-                                              colors=colors[:len(security_count)],
+                                              colors=_SECURITY_COLORS[:len(cols.security)],
                                               startangle=90)
             
             ax4.set_title('Security Types Distribution', fontweight='bold', pad=20)
             
             # Make the plot better
-            plt.tight_layout()
-            plt.subplots_adjust(top=0.93)
+            fig.tight_layout()
+            fig.subplots_adjust(top=0.93)
             
             # Save the plot
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             plot_file = f"analysis_plots/rf_analysis_{timestamp}.png"
-            plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+            fig.savefig(plot_file, dpi=150)
             print(f"\n💾 Analysis plot saved: {plot_file}")
             
             # Show the plot
             plt.show()
             
             # Generate additional detailed plot
-            self._generate_detailed_plot(data, timestamp)
+            self._generate_detailed_plot(data, timestamp, cols)
             
         except Exception as e:
             print(f"[!] Plot generation error: {e}")
     
-    def _generate_detailed_plot(self, data, timestamp):
+    def _generate_detailed_plot(self, data, timestamp, cols):
         """Generate additional detailed analysis plot"""
         try:
-            devices = data['devices']
-            
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+            fig, (ax1, ax2) = self._get_figure('details', 1, 2, (16, 6))
             fig.suptitle('RF Signal Detector - Network Details\nSignal Research Lab', 
                         fontsize=14, fontweight='bold')
             
             # Plot 1: Networks by channel with strength heatmap
-            channels = [d['channel'] for d in devices]
-            strengths = [d['strength'] for d in devices]
-            ssids = [d.get('ssid', 'Hidden') for d in devices]
+            unique_channels = cols.unique_channels
             
             # Create channel-strength matrix
-            unique_channels = sorted(set(channels))
-            strength_matrix = []
+            sums, cnts = _chan_avg(cols.channels, cols.strengths, int(unique_channels[-1]))
+            strength_matrix = sums[unique_channels] / np.maximum(cnts[unique_channels], 1)
             
-            for channel in unique_channels:
-                channel_strengths = [s for c, s in zip(channels, strengths) if c == channel]
-                avg_strength = sum(channel_strengths) / len(channel_strengths) if channel_strengths else -90
-                strength_matrix.append(avg_strength)
-            
-            im = ax1.imshow([strength_matrix], cmap='RdYlGn_r', aspect='auto', 
+            im = ax1.imshow(strength_matrix[np.newaxis, :], cmap='RdYlGn_r', aspect='auto', 
                            extent=[min(unique_channels)-0.5, max(unique_channels)+0.5, 0, 1])
             ax1.set_xlabel('WiFi Channel')
             ax1.set_title('Channel Signal Strength Heatmap', fontweight='bold')
             ax1.set_yticks([])
-            plt.colorbar(im, ax=ax1, label='Average Signal Strength (dBm)')
+            self._colorbars['details'] = [fig.colorbar(im, ax=ax1, label='Average Signal Strength (dBm)')]
             
             # Plot 2: Network type distribution
-            visible_count = len([ssid for ssid in ssids if ssid and ssid != 'Hidden'])
-            hidden_count = len([ssid for ssid in ssids if not ssid or ssid == 'Hidden'])
-            
             labels = ['Visible Networks', 'Hidden Networks']
-            sizes = [visible_count, hidden_count]
-            colors = ['#4CAF50', '#FF9800']
+            sizes = [cols.visible, cols.hidden]
             
-            ax2.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+            ax2.pie(sizes, labels=labels, colors=_VISIBILITY_COLORS, autopct='%1.1f%%',
                    startangle=90, textprops={'fontweight': 'bold'})
             ax2.set_title('Network Visibility Distribution', fontweight='bold')
             
-            plt.tight_layout()
-            plt.subplots_adjust(top=0.85)
+            fig.tight_layout()
+            fig.subplots_adjust(top=0.85)
             
             # Save detailed plot
             detail_file = f"analysis_plots/rf_details_{timestamp}.png"
-            plt.savefig(detail_file, dpi=300, bbox_inches='tight')
+            fig.savefig(detail_file, dpi=150)
             print(f"💾 Detailed plot saved: {detail_file}")
             
             plt.show()